@@ -4,23 +4,33 @@ Fetches news, analyzes sentiment, and outputs a normalized score (-1 to +1)
 Updates: Every minute via GitHub Actions
 """
 
+import asyncio
+import aiohttp
+import calendar
 import feedparser
-import requests
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+import hashlib
+import json
+import re
+import string
+from vaderSentiment.vaderSentiment import N_SCALAR, SentimentIntensityAnalyzer, negated
 from datetime import datetime, timedelta, timezone
 import yfinance as yf
+import pandas as pd
+import numpy as np
 import time
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 # ==================== CONFIG ====================
-NEWS_RSS_FEEDS = [
+NEWS_RSS_FEEDS = (
     "https://www.kitco.com/rss/all.xml",
     "https://www.fxstreet.com/rss/news",
     "https://www.investing.com/rss/news_285.rss",
     "https://www.dailyfx.com/rss/gold",
     "https://www.forexlive.com/feed/news",
-]
+)
 
-RELEVANT_KEYWORDS = [
+RELEVANT_KEYWORDS = (
     "gold", "xau", "xauusd", "precious metal",
     "fed", "federal reserve", "powell", "fomc",
     "inflation", "cpi", "ppi", "pce", "deflation",
@@ -32,18 +42,47 @@ RELEVANT_KEYWORDS = [
     "nfp", "employment", "unemployment", "jobs",
     "recession", "crisis", "uncertainty", "volatility",
     "central bank", "stimulus", "tapering", "qe"
-]
+)
+
+# Single-pass matcher for all keywords, compiled once at import. Longest
+# keywords go first; only the leading edge is anchored to a word boundary
+# so plurals ("rates", "yields") still match but "corporate" doesn't hit "rate".
+KEYWORD_RE = re.compile(
+    r"\b(?:" + "|".join(sorted(map(re.escape, RELEVANT_KEYWORDS), key=len, reverse=True)) + ")"
+)
+
+USER_AGENT = "gold-sentiment-feed/1.0 (+https://github.com/samuelnjerungari/gold-sentiment-feed)"
+REQUEST_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8",
+}
 
 OUTPUT_FILE_PATH = "market_context.csv"
 RECENCY_HOURS = 2  # Only look at news from last 2 hours (very recent)
 
+# Reuse news results across repeated runs (e.g. crash-retry)
+NEWS_CACHE_PATH = "market_context.cache.json"
+NEWS_CACHE_TTL = 60       # Seconds a result on disk stays valid
+NEWS_CACHE_BUCKET = 300   # In-process memoization window in seconds
+
+# VADER slows down badly on long or emoji-heavy text - trim before scoring
+MAX_TITLE_LENGTH = 200
+MAX_EMOJI_CHARS = 20
+
+# Score multi-word GOLD_LEXICON phrases ("rate cut", "safe haven") separately,
+# since VADER only looks up single tokens
+USE_PHRASE_SCORING = True
+
+MARKET_SYMBOLS = ("DX-Y.NYB", "^TNX", "^VIX")  # Dollar Index, 10Y yield, VIX
+
+YF_CACHE_DIR = os.path.join(".cache", "yf")
+YF_CACHE_TTL = 300  # Reuse downloaded price history for 5 minutes
+
 # Weights for final score calculation
-WEIGHTS = {
-    "news_sentiment": 0.60,      # 60% - News headlines (most important)
-    "dxy_signal": 0.20,          # 20% - Dollar strength
-    "yield_signal": 0.10,        # 10% - Treasury yields
-    "vix_signal": 0.10,          # 10% - Fear index
-}
+W_NEWS = 0.60      # 60% - News headlines (most important)
+W_DXY = 0.20       # 20% - Dollar strength
+W_YIELD = 0.10     # 10% - Treasury yields
+W_VIX = 0.10       # 10% - Fear index
 
 # ==================== CUSTOM GOLD LEXICON ====================
 GOLD_LEXICON = {
@@ -78,24 +117,118 @@ GOLD_LEXICON = {
     "selling gold": -2.5, "gold selloff": -3.0,
 }
 
+# VADER can only use the single-word entries; phrases get their own matcher
+GOLD_WORDS = {k: v for k, v in GOLD_LEXICON.items() if " " not in k}
+GOLD_PHRASES = {k: v for k, v in GOLD_LEXICON.items() if " " in k}
+# The lookahead lets overlapping phrases all match: "strong dollar rally"
+# counts both "strong dollar" and "dollar rally"
+PHRASE_RE = re.compile(
+    r"\b(?=(" + "|".join(sorted(map(re.escape, GOLD_PHRASES), key=len, reverse=True)) + "))"
+)
+# Headline idioms that negate a following phrase but aren't in VADER's NEGATE list
+PHRASE_NEGATION_RE = re.compile(r"\b(?:rules? out|ruled out|rejects?|dismiss(?:es)?)\b")
+
 # ==================== SENTIMENT ANALYZER ====================
-def fetch_news_sentiment():
-    """Fetch and analyze news headlines with custom Gold lexicon"""
-    print(f"\n{'='*70}")
-    print("📰 FETCHING NEWS SENTIMENT")
-    print(f"{'='*70}")
+# Built once at import - loading the VADER lexicon from disk is the slow part
+ANALYZER = SentimentIntensityAnalyzer()
+ANALYZER.lexicon.update(GOLD_WORDS)
+LEXICON_KEYS = frozenset(ANALYZER.lexicon)
+# VADER 3.3+ swaps these for scored descriptions; older versions have no emoji table
+EMOJI_CHARS = frozenset(getattr(ANALYZER, "emojis", ()))
+
+def _vader_safe(title):
+    """Trim a headline so it can't stall VADER's emoji handling"""
+    if sum(1 for c in title if ord(c) > 0x2600) > MAX_EMOJI_CHARS:
+        title = "".join(c for c in title if ord(c) <= 0x2600)
+    return title[:MAX_TITLE_LENGTH]
+
+def _has_lexicon_hit(title_lower):
+    """Cheap check for whether VADER would find any scored word in a title
+    
+    Tokens are split and punctuation-stripped the way VADER does it, so a
+    miss here means polarity_scores would return a compound of 0.0.
+    """
+    for token in title_lower.split():
+        if token in LEXICON_KEYS or token.strip(string.punctuation) in LEXICON_KEYS:
+            return True
+    return False
+
+def _phrase_score(title_lower):
+    """Score GOLD_PHRASES found in a title on VADER's compound scale
+    
+    A phrase preceded by a negation within 3 tokens ("rules out rate cut")
+    is flipped and damped the way VADER treats negated words. Returns None
+    when no phrase matches.
+    """
+    total = 0.0
+    matched = False
     
-    analyzer = SentimentIntensityAnalyzer()
-    analyzer.lexicon.update(GOLD_LEXICON)
+    for match in PHRASE_RE.finditer(title_lower):
+        value = GOLD_PHRASES[match.group(1)]
+        window = title_lower[:match.start()].split()[-3:]
+        if negated(window) or PHRASE_NEGATION_RE.search(" ".join(window)):
+            value *= N_SCALAR
+        total += value
+        matched = True
+    
+    if not matched:
+        return None
+    
+    return max(-1.0, min(1.0, total / 4.0))
+
+async def _fetch(session, feed_url):
+    """Download the raw bytes and response headers of a single RSS feed"""
+    async with session.get(feed_url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+        response.raise_for_status()
+        return feed_url, await response.read(), response.headers
+
+async def _fetch_all_feeds():
+    """Download every feed concurrently on one event loop
+    
+    Failed downloads come back as exception objects instead of raising,
+    so one bad feed doesn't kill the batch.
+    """
+    async with aiohttp.ClientSession(headers=REQUEST_HEADERS) as session:
+        return await asyncio.gather(
+            *[_fetch(session, feed_url) for feed_url in NEWS_RSS_FEEDS],
+            return_exceptions=True,
+        )
+
+def _fetch_news_impl(log):
+    """Fetch and analyze news headlines with custom Gold lexicon
+    
+    Returns (score, fetched) where fetched is False if no feed could be
+    downloaded and parsed, so callers don't cache a failed run.
+    """
+    log.append(f"\n{'='*70}")
+    log.append("📰 FETCHING NEWS SENTIMENT")
+    log.append(f"{'='*70}")
     
     cutoff_time = datetime.now(timezone.utc) - timedelta(hours=RECENCY_HOURS)
-    headlines = []
+    cutoff_epoch = cutoff_time.timestamp()
+    scores = []
     seen = set()
+    fetched = False
+    
+    # Network fetches run concurrently; feeds are parsed and scored serially below
+    responses = asyncio.run(_fetch_all_feeds())
     
-    for feed_url in NEWS_RSS_FEEDS:
+    for feed_url, response in zip(NEWS_RSS_FEEDS, responses):
+        log.append(f"\n🔍 Fetching: {feed_url}")
+        
+        if isinstance(response, Exception):
+            log.append(f"   ❌ ERROR: {type(response).__name__}: {response}")
+            continue
+        
         try:
-            print(f"\n🔍 Fetching: {feed_url}")
-            feed = feedparser.parse(feed_url, timeout=10)
+            _, body, headers = response
+            # Pass Content-Type through so feeds declaring their charset
+            # only in the HTTP header still decode correctly
+            content_type = headers.get("Content-Type")
+            feed = feedparser.parse(
+                body,
+                response_headers={"content-type": content_type} if content_type else None,
+            )
             feed_count = 0
             
             for entry in feed.entries:
@@ -104,61 +237,164 @@ def fetch_news_sentiment():
                 
                 # Check recency
                 pub_date = entry.get('published_parsed') or entry.get('updated_parsed')
-                if pub_date:
-                    pub_datetime = datetime(*pub_date[:6], tzinfo=timezone.utc)
-                    if pub_datetime < cutoff_time:
-                        continue
+                if pub_date and calendar.timegm(pub_date[:6]) < cutoff_epoch:
+                    continue
                 
                 # Check keywords
-                if not any(kw in title_lower for kw in RELEVANT_KEYWORDS):
+                if not KEYWORD_RE.search(title_lower):
                     continue
                 
-                # Remove duplicates
-                if title_lower in seen:
+                # Remove duplicates (keyed on an 8-byte digest, not the full title)
+                title_key = hashlib.blake2b(title_lower.encode(), digest_size=8).digest()
+                if title_key in seen:
                     continue
-                seen.add(title_lower)
+                seen.add(title_key)
+                
+                # Analyze sentiment (skip VADER for titles it can't score;
+                # titles with emoji always go through for its emoji handling)
+                phrase_score = _phrase_score(title_lower) if USE_PHRASE_SCORING else None
                 
-                # Analyze sentiment
-                score = analyzer.polarity_scores(title)['compound']
-                headlines.append((title, score))
+                if not _has_lexicon_hit(title_lower) and EMOJI_CHARS.isdisjoint(title):
+                    score = 0.0
+                else:
+                    score = ANALYZER.polarity_scores(_vader_safe(title))['compound']
+                
+                # Blend in phrase hits; when VADER scores 0.0 they stand alone
+                if phrase_score is not None:
+                    score = phrase_score if score == 0.0 else (score + phrase_score) / 2
+                scores.append(score)
                 feed_count += 1
                 
                 # Show analysis
                 sentiment_label = "🟢 BULLISH" if score > 0.1 else "🔴 BEARISH" if score < -0.1 else "⚪ NEUTRAL"
-                print(f"   {sentiment_label} [{score:+.3f}] {title[:80]}")
+                log.append(f"   {sentiment_label} [{score:+.3f}] {title[:80]}")
             
-            print(f"   ✅ Found {feed_count} relevant headlines from this feed")
+            log.append(f"   ✅ Found {feed_count} relevant headlines from this feed")
+            fetched = True
         
         except Exception as e:
-            print(f"   ❌ ERROR: {e}")
+            log.append(f"   ❌ ERROR: {e}")
     
-    if not headlines:
-        print("\n⚠️  WARNING: No relevant headlines found in the last 2 hours.")
-        print("   Using neutral score (0.0)")
-        return 0.0
+    if not scores:
+        log.append("\n⚠️  WARNING: No relevant headlines found in the last 2 hours.")
+        log.append("   Using neutral score (0.0)")
+        return 0.0, fetched
+    
+    avg_sentiment = float(np.asarray(scores, dtype=np.float32).mean())
     
-    avg_sentiment = sum(score for _, score in headlines) / len(headlines)
+    log.append(f"\n{'─'*70}")
+    log.append(f"📊 Total headlines analyzed: {len(scores)}")
+    log.append(f"📈 Average news sentiment: {avg_sentiment:+.4f}")
+    log.append(f"{'─'*70}")
     
-    print(f"\n{'─'*70}")
-    print(f"📊 Total headlines analyzed: {len(headlines)}")
-    print(f"📈 Average news sentiment: {avg_sentiment:+.4f}")
-    print(f"{'─'*70}")
+    return avg_sentiment, fetched
+
+_NEWS_MEMO = {}
+
+def _cached_news(bucket):
+    """Memoize the news step per NEWS_CACHE_BUCKET-second window
+    
+    Runs where no feed could be fetched aren't memoized, so a retry in
+    the same window goes back to the network.
+    """
+    if bucket in _NEWS_MEMO:
+        return _NEWS_MEMO[bucket]
+    
+    log = []
+    score, fetched = _fetch_news_impl(log)
+    result = (score, tuple(log), fetched)
+    
+    if fetched:
+        _NEWS_MEMO.clear()  # Only the current bucket is ever looked up
+        _NEWS_MEMO[bucket] = result
+    
+    return result
+
+def _load_news_cache(now):
+    """Return (score, log, age) from NEWS_CACHE_PATH, or None if missing/expired"""
+    try:
+        with open(NEWS_CACHE_PATH) as f:
+            cached = json.load(f)
+        age = now - cached["timestamp"]
+        if 0 <= age < NEWS_CACHE_TTL:
+            return cached["score"], cached["log"], age
+    except Exception:
+        pass  # Missing or unreadable cache - fetch instead
+    return None
+
+def _save_news_cache(now, score, log):
+    """Persist the news result for other processes (e.g. a retried run)"""
+    try:
+        tmp_path = NEWS_CACHE_PATH + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"timestamp": now, "score": score, "log": list(log)}, f)
+        os.replace(tmp_path, NEWS_CACHE_PATH)
+    except Exception:
+        pass  # Caching is best-effort
+
+def fetch_news_sentiment(log):
+    """Average news sentiment, reusing a recent result when there is one
+    
+    Output lines are appended to `log` rather than printed, so callers
+    running this in a worker thread can emit them later in one write.
+    The same applies to the get_*_signal functions below.
+    """
+    now = time.time()
     
-    return avg_sentiment
+    cached = _load_news_cache(now)
+    if cached is not None:
+        score, cached_log, age = cached
+        log.extend(cached_log)
+        log.append(f"♻️  Reused news sentiment cached {age:.0f}s ago")
+        return score
+    
+    score, news_log, fetched = _cached_news(int(now // NEWS_CACHE_BUCKET))
+    log.extend(news_log)
+    if fetched:
+        _save_news_cache(now, score, news_log)
+    return score
 
 # ==================== MARKET INDICATORS ====================
-def get_dxy_signal():
+def _cached_closes(period="5d"):
+    """Daily closes for all MARKET_SYMBOLS with a small on-disk cache
+    
+    All symbols come from one batched yf.download call. Runs fire every
+    minute but daily bars barely move in between, so a fresh copy is only
+    downloaded once YF_CACHE_TTL has passed.
+    """
+    path = os.path.join(YF_CACHE_DIR, f"closes_{period}.pkl")
+    
+    try:
+        if time.time() - os.path.getmtime(path) < YF_CACHE_TTL:
+            return pd.read_pickle(path)
+    except Exception:
+        pass  # Missing or unreadable cache - download instead
+    
+    data = yf.download(
+        list(MARKET_SYMBOLS), period=period, interval="1d",
+        progress=False, threads=True,
+    )
+    # Symbols trade on different calendars, so columns may hold NaN gaps
+    closes = data["Close"].reindex(columns=list(MARKET_SYMBOLS))
+    
+    # Only cache complete batches so a failed symbol is retried next run
+    if closes.notna().any().all():
+        os.makedirs(YF_CACHE_DIR, exist_ok=True)
+        closes.to_pickle(path)
+    
+    return closes
+
+def get_dxy_signal(series, log):
     """Dollar Index signal (inverse relationship with Gold)"""
     try:
-        dxy = yf.Ticker("DX-Y.NYB")
-        hist = dxy.history(period="5d")
+        hist = series.dropna()
         
         if len(hist) < 2:
-            print("⚠️  DXY: Insufficient data")
+            log.append("⚠️  DXY: Insufficient data")
             return 0.0
         
-        current = hist['Close'].iloc[-1]
-        week_ago = hist['Close'].iloc[0]
+        current = hist.iloc[-1]
+        week_ago = hist.iloc[0]
         change_pct = ((current - week_ago) / week_ago) * 100
         
         # Strong dollar = bearish for Gold (negative signal)
@@ -166,25 +402,24 @@ def get_dxy_signal():
         signal = max(-1.0, min(1.0, signal))
         
         direction = "📉 Falling" if change_pct < 0 else "📈 Rising"
-        print(f"💵 DXY: {current:.2f} | {direction} {abs(change_pct):.2f}% | Signal: {signal:+.3f}")
+        log.append(f"💵 DXY: {current:.2f} | {direction} {abs(change_pct):.2f}% | Signal: {signal:+.3f}")
         return signal
     
     except Exception as e:
-        print(f"❌ DXY Error: {e}")
+        log.append(f"❌ DXY Error: {e}")
         return 0.0
 
-def get_yield_signal():
+def get_yield_signal(series, log):
     """10-Year Treasury Yield signal"""
     try:
-        tnx = yf.Ticker("^TNX")
-        hist = tnx.history(period="5d")
+        hist = series.dropna()
         
         if len(hist) < 2:
-            print("⚠️  Yield: Insufficient data")
+            log.append("⚠️  Yield: Insufficient data")
             return 0.0
         
-        current = hist['Close'].iloc[-1]
-        week_ago = hist['Close'].iloc[0]
+        current = hist.iloc[-1]
+        week_ago = hist.iloc[0]
         change = current - week_ago
         
         # Rising yields = bearish for Gold
@@ -192,24 +427,23 @@ def get_yield_signal():
         signal = max(-1.0, min(1.0, signal))
         
         direction = "📉 Falling" if change < 0 else "📈 Rising"
-        print(f"📊 10Y Yield: {current:.2f}% | {direction} {abs(change):.2f}% | Signal: {signal:+.3f}")
+        log.append(f"📊 10Y Yield: {current:.2f}% | {direction} {abs(change):.2f}% | Signal: {signal:+.3f}")
         return signal
     
     except Exception as e:
-        print(f"❌ Yield Error: {e}")
+        log.append(f"❌ Yield Error: {e}")
         return 0.0
 
-def get_vix_signal():
+def get_vix_signal(series, log):
     """VIX Fear Index signal"""
     try:
-        vix = yf.Ticker("^VIX")
-        hist = vix.history(period="5d")
+        hist = series.dropna()
         
         if len(hist) < 1:
-            print("⚠️  VIX: Insufficient data")
+            log.append("⚠️  VIX: Insufficient data")
             return 0.0
         
-        current = hist['Close'].iloc[-1]
+        current = hist.iloc[-1]
         
         # VIX interpretation
         if current > 30:
@@ -231,11 +465,11 @@ def get_vix_signal():
             signal = 0.0      # Normal
             level = "😐 NORMAL"
         
-        print(f"📉 VIX: {current:.2f} | {level} | Signal: {signal:+.3f}")
+        log.append(f"📉 VIX: {current:.2f} | {level} | Signal: {signal:+.3f}")
         return signal
     
     except Exception as e:
-        print(f"❌ VIX Error: {e}")
+        log.append(f"❌ VIX Error: {e}")
         return 0.0
 
 # ==================== MAIN CALCULATION ====================
@@ -246,23 +480,35 @@ def calculate_market_context():
     print(f"    Timestamp: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}")
     print(f"{'='*70}\n")
     
-    # Fetch all components
-    news_score = fetch_news_sentiment()
+    # News and market data are fetched in parallel
+    log = []
     
-    print(f"\n{'='*70}")
-    print("📊 MARKET INDICATORS")
-    print(f"{'='*70}")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        news_future = executor.submit(fetch_news_sentiment, log)
+        closes_future = executor.submit(_cached_closes)
+        
+        news_score = news_future.result()
+        
+        log.append(f"\n{'='*70}")
+        log.append("📊 MARKET INDICATORS")
+        log.append(f"{'='*70}")
+        
+        try:
+            closes = closes_future.result()
+        except Exception as e:
+            log.append(f"❌ Market data Error: {e}")
+            closes = pd.DataFrame(columns=list(MARKET_SYMBOLS), dtype=float)
     
-    dxy_score = get_dxy_signal()
-    yield_score = get_yield_signal()
-    vix_score = get_vix_signal()
+    dxy_score = get_dxy_signal(closes["DX-Y.NYB"], log)
+    yield_score = get_yield_signal(closes["^TNX"], log)
+    vix_score = get_vix_signal(closes["^VIX"], log)
     
     # Weighted average
     final_score = (
-        news_score * WEIGHTS["news_sentiment"] +
-        dxy_score * WEIGHTS["dxy_signal"] +
-        yield_score * WEIGHTS["yield_signal"] +
-        vix_score * WEIGHTS["vix_signal"]
+        news_score * W_NEWS +
+        dxy_score * W_DXY +
+        yield_score * W_YIELD +
+        vix_score * W_VIX
     )
     
     # Clamp between -1 and +1
@@ -281,25 +527,35 @@ def calculate_market_context():
         bias = "🔴 STRONGLY BEARISH"
     
     # Display breakdown
-    print(f"\n{'='*70}")
-    print("📊 FINAL CALCULATION")
-    print(f"{'='*70}")
-    print(f"📰 News Sentiment:    {news_score:+.4f} × {WEIGHTS['news_sentiment']:.0%} = {news_score * WEIGHTS['news_sentiment']:+.4f}")
-    print(f"💵 DXY Signal:        {dxy_score:+.4f} × {WEIGHTS['dxy_signal']:.0%} = {dxy_score * WEIGHTS['dxy_signal']:+.4f}")
-    print(f"📊 Yield Signal:      {yield_score:+.4f} × {WEIGHTS['yield_signal']:.0%} = {yield_score * WEIGHTS['yield_signal']:+.4f}")
-    print(f"📉 VIX Signal:        {vix_score:+.4f} × {WEIGHTS['vix_signal']:.0%} = {vix_score * WEIGHTS['vix_signal']:+.4f}")
-    print(f"{'─'*70}")
-    print(f"🎯 FINAL SCORE:       {final_score:+.4f}")
-    print(f"📈 MARKET BIAS:       {bias}")
-    print(f"{'='*70}\n")
+    log.append(f"\n{'='*70}")
+    log.append("📊 FINAL CALCULATION")
+    log.append(f"{'='*70}")
+    log.append(f"📰 News Sentiment:    {news_score:+.4f} × {W_NEWS:.0%} = {news_score * W_NEWS:+.4f}")
+    log.append(f"💵 DXY Signal:        {dxy_score:+.4f} × {W_DXY:.0%} = {dxy_score * W_DXY:+.4f}")
+    log.append(f"📊 Yield Signal:      {yield_score:+.4f} × {W_YIELD:.0%} = {yield_score * W_YIELD:+.4f}")
+    log.append(f"📉 VIX Signal:        {vix_score:+.4f} × {W_VIX:.0%} = {vix_score * W_VIX:+.4f}")
+    log.append(f"{'─'*70}")
+    log.append(f"🎯 FINAL SCORE:       {final_score:+.4f}")
+    log.append(f"📈 MARKET BIAS:       {bias}")
+    log.append(f"{'='*70}\n")
+    
+    # Emit everything in a single write
+    print("\n".join(log))
     
     return final_score
 
 def save_score(score):
     """Save score to CSV file"""
     try:
-        with open(OUTPUT_FILE_PATH, 'w') as f:
-            f.write(f"{score:.4f}")
+        # Write to a temp file and rename over the target so readers
+        # never see a truncated/empty file
+        tmp_path = OUTPUT_FILE_PATH + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, b"%.4f" % score)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, OUTPUT_FILE_PATH)
         print(f"✅ Successfully wrote score to {OUTPUT_FILE_PATH}")
         return True
     except Exception as e: